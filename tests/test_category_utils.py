@@ -0,0 +1,30 @@
+from tools.category_utils import alphabetic_suffix, allocate_id, allocate_slug
+
+
+def test_alphabetic_suffix_sequence() -> None:
+    assert [alphabetic_suffix(i) for i in (0, 1, 25, 26, 27, 701, 702)] == [
+        "A",
+        "B",
+        "Z",
+        "AA",
+        "AB",
+        "ZZ",
+        "AAA",
+    ]
+
+
+def test_allocate_slug_skips_suffixes_claimed_by_other_bases() -> None:
+    existing: set[str] = set()
+    counters: dict[str, int] = {}
+    assert allocate_slug("document-x-a", existing, counters) == "document-x-a"
+    assert allocate_slug("document-x", existing, counters) == "document-x"
+    assert allocate_slug("document-x", existing, counters) == "document-x-b"
+    assert allocate_slug("document-x", existing, counters) == "document-x-c"
+
+
+def test_allocate_id_appends_suffixes() -> None:
+    existing: set[str] = set()
+    counters: dict[str, int] = {}
+    assert allocate_id("DocumentX", existing, counters) == "DocumentX"
+    assert allocate_id("DocumentX", existing, counters) == "DocumentXA"
+    assert allocate_id("DocumentX", existing, counters) == "DocumentXB"
@@ -1,11 +1,14 @@
+import os
 from pathlib import Path
 
 import pytest
 
+from tools._paper_cache import load_cache, save_cache
 from tools.render_ftl import (
     FTL_PREFIX_MARKER,
     PaperParseError,
     discover_documents,
+    normalise_component,
     render_documents_yaml,
     render_ftl,
 )
@@ -102,6 +105,23 @@ def test_empty_document_raises(tmp_path: Path) -> None:
         discover_documents(docs_dir)
 
 
+def test_discovery_orders_documents_and_reports_first_error(tmp_path: Path) -> None:
+    docs_dir = tmp_path / "docs"
+    for index in range(40):
+        write_paper(docs_dir / f"cat-{index % 4}" / f"doc-{index:02}.paper", f"Doc {index}", "x\n")
+
+    documents = discover_documents(docs_dir)
+    assert [(doc.categories, doc.slug) for doc in documents] == sorted(
+        (doc.categories, doc.slug) for doc in documents
+    )
+    assert len(documents) == 40
+
+    (docs_dir / "cat-3" / "doc-07.paper").write_text("no title\n", encoding="utf-8")
+    (docs_dir / "cat-1" / "doc-33.paper").write_text("no title\n", encoding="utf-8")
+    with pytest.raises(PaperParseError, match="doc-33"):
+        discover_documents(docs_dir)
+
+
 def test_render_ftl_bracket_lines_prefixed(tmp_path: Path) -> None:
     docs_dir = tmp_path / "docs"
     write_paper(
@@ -119,3 +139,95 @@ def test_render_ftl_bracket_lines_prefixed(tmp_path: Path) -> None:
     assert lines[key_index + 2] == "    Some text"
     assert lines[key_index + 3] == f"    {FTL_PREFIX_MARKER}"
     assert lines[key_index + 4] == f"    {FTL_PREFIX_MARKER}"
+
+
+def test_body_lines_split_on_newlines_only(tmp_path: Path) -> None:
+    docs_dir = tmp_path / "docs"
+    doc_path = docs_dir / "misc" / "breaks.paper"
+    doc_path.parent.mkdir(parents=True, exist_ok=True)
+    doc_path.write_bytes("# Breaks\r\nbody\x0cmore\rx\u2028y\n\n".encode("utf-8"))
+
+    (document,) = discover_documents(docs_dir)
+
+    assert document.body_lines == ("body\x0cmore", "x\u2028y", "")
+
+
+def test_discovers_txt_and_paper_documents(tmp_path: Path) -> None:
+    docs_dir = tmp_path / "docs"
+    write_paper(docs_dir / "security" / "incident.paper", "Incident", "Details\n")
+    write_paper(docs_dir / "security" / "warrant.txt", "Warrant", "Details\n")
+    write_paper(docs_dir / "security" / "_draft.paper", "Draft", "Details\n")
+    (docs_dir / "security" / "notes.md").write_text("# Notes\n", encoding="utf-8")
+
+    documents = discover_documents(docs_dir)
+    assert [doc.slug for doc in documents] == ["incident", "warrant"]
+
+
+def test_document_cache_reuses_unchanged_entries(tmp_path: Path) -> None:
+    docs_dir = tmp_path / "docs"
+    paper = docs_dir / "security" / "incident.paper"
+    write_paper(paper, "Incident", "Details\n")
+
+    cache: dict = {}
+    first = discover_documents(docs_dir, cache)
+    assert list(cache) == [str(paper)]
+
+    cached = cache[str(paper)]
+    cached[2]["title"] = "From cache"
+    second = discover_documents(docs_dir, cache)
+    assert second[0].title == "From cache"
+    assert second[0].fluent_key == first[0].fluent_key
+
+    write_paper(paper, "Incident Report", "More details\n")
+    third = discover_documents(docs_dir, cache)
+    assert third[0].title == "Incident Report"
+
+
+@pytest.mark.parametrize(
+    "mangle",
+    [
+        lambda entry: entry[2].pop("slug"),
+        lambda entry: entry[2].__setitem__("body_lines", "Details"),
+        lambda entry: entry.pop(),
+        lambda entry: entry.__setitem__(2, ["not", "a", "payload"]),
+    ],
+)
+def test_document_cache_reparses_malformed_entries(tmp_path: Path, mangle) -> None:
+    docs_dir = tmp_path / "docs"
+    paper = docs_dir / "security" / "incident.paper"
+    write_paper(paper, "Incident", "Details\n")
+
+    cache: dict = {}
+    discover_documents(docs_dir, cache)
+    mangle(cache[str(paper)])
+    assert discover_documents(docs_dir, cache)[0].title == "Incident"
+
+    cache[str(paper)] = {"slug": "incident"}
+    assert discover_documents(docs_dir, cache)[0].title == "Incident"
+
+
+def test_save_cache_skips_unchanged_file(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    entries = {"doc.paper": [1, 2, {"slug": "doc"}]}
+    save_cache(cache_path, entries)
+    os.utime(cache_path, ns=(0, 0))
+
+    save_cache(cache_path, entries)
+    assert cache_path.stat().st_mtime_ns == 0
+    assert load_cache(cache_path) == entries
+
+
+@pytest.mark.parametrize(
+    ("component", "expected"),
+    [
+        ("Engineering & Logistics (Cargo)", "engineering-logistics"),
+        ("04 Medical", "medical"),
+        ("Form_Post-Transplant_ID", "form-post-transplant-id"),
+        ("a-1-b", "a-b"),
+        ("Alpha2Beta", "alphabeta"),
+        ("--Édition--", "dition"),
+        ("123", ""),
+    ],
+)
+def test_normalise_component_edge_cases(component: str, expected: str) -> None:
+    assert normalise_component(component) == expected
@@ -3,6 +3,7 @@ from pathlib import Path
 from tools.render_ftl import discover_documents
 from tools.render_starlight import (
     build_category_infos,
+    group_documents,
     render_lathe_categories,
     render_lathe_category_prototypes,
     render_recipe_pack,
@@ -31,14 +32,18 @@ def test_render_outputs_cover_all_sections(tmp_path: Path) -> None:
 
     documents = discover_documents(docs_dir)
     categories = build_category_infos(documents, {})
+    groups = group_documents(documents, categories)
+    identity_info, identity_entries = groups[0]
+    assert identity_info.raw_label == "Identity"
+    assert identity_entries[0].entity_id == "PrintedDocumentIdentityIdReplacement"
+    assert identity_entries[0].recipe_id == "PrintedDocumentIdentityIdReplacementRecipe"
 
-    prototypes = render_starlight_documents(documents, categories, hide_spawn_menu=True)
+    prototypes = render_starlight_documents(groups, hide_spawn_menu=True)
     assert "PrintedDocumentIdentityIdReplacement" in prototypes
     assert "categories: [ HideSpawnMenu ]" in prototypes
 
     recipes = render_starlight_recipes(
-        documents,
-        categories,
+        groups,
         recipe_categories={},
         completetime=3,
         materials={"SheetPrinter": 40},
@@ -50,7 +55,7 @@ def test_render_outputs_cover_all_sections(tmp_path: Path) -> None:
     assert "    - DocumentSecurity" in recipes
     assert "SheetPrinter: 40" in recipes
 
-    pack = render_recipe_pack(documents, categories, pack_id="MyDocs")
+    pack = render_recipe_pack(groups, pack_id="MyDocs")
     assert "- type: latheRecipePack" in pack
     assert "MyDocs" in pack
     assert "PrintedDocumentSecurityAccessReviewRecipe" in pack
@@ -86,3 +91,43 @@ def test_duplicate_category_slugs_get_disambiguated(tmp_path: Path) -> None:
     prototype_output = render_lathe_category_prototypes(categories)
     assert "id: DocumentAlpha" in prototype_output
     assert "id: DocumentAlphaA" in prototype_output
+
+
+def test_group_documents_buckets_by_primary_category_in_title_order(tmp_path: Path) -> None:
+    docs_dir = tmp_path / "docs"
+    write_paper(docs_dir / "01 Security" / "zulu.paper", "zulu Order", "[body]\n")
+    write_paper(docs_dir / "01 Security" / "Warrants" / "alpha.paper", "Alpha Warrant", "[body]\n")
+    write_paper(docs_dir / "02 Medical" / "beta.paper", "Beta Form", "[body]\n")
+
+    documents = discover_documents(docs_dir)
+    groups = group_documents(documents, build_category_infos(documents, {}))
+
+    assert [info.raw_label for info, _ in groups] == ["Security", "Medical"]
+    assert [entry.doc.title for entry in groups[0][1]] == ["Alpha Warrant", "zulu Order"]
+
+
+def test_group_documents_orders_duplicate_titles_by_path(tmp_path: Path) -> None:
+    docs_dir = tmp_path / "docs"
+    write_paper(docs_dir / "Sec" / "01 - Forms" / "zz.txt", "Request Form", "[body]\n")
+    write_paper(docs_dir / "Sec" / "Archive" / "aa.txt", "Request Form", "[body]\n")
+
+    documents = discover_documents(docs_dir)
+    groups = group_documents(documents, build_category_infos(documents, {}))
+
+    assert [entry.doc.path.name for entry in groups[0][1]] == ["zz.txt", "aa.txt"]
+
+
+def test_category_ids_stay_unique_across_colliding_bases(tmp_path: Path) -> None:
+    docs_dir = tmp_path / "docs"
+    write_paper(docs_dir / "01 Alpha" / "first.paper", "First", "[body]\n")
+    write_paper(docs_dir / "02 Alpha!!" / "second.paper", "Second", "[body]\n")
+    write_paper(docs_dir / "03 Alpha A" / "third.paper", "Third", "[body]\n")
+
+    documents = discover_documents(docs_dir)
+    categories = build_category_infos(documents, {})
+
+    assert [(info.lathe_key, info.lathe_id) for info in categories] == [
+        ("document-alpha", "DocumentAlpha"),
+        ("document-alpha-a", "DocumentAlphaA"),
+        ("document-alpha-a-a", "DocumentAlphaAA"),
+    ]
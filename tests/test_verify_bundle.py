@@ -1,5 +1,7 @@
+import os
 from pathlib import Path
 
+import pytest
 import yaml
 
 from tools.render_ftl import (
@@ -10,13 +12,21 @@ from tools.render_ftl import (
 )
 from tools.render_starlight import (
     build_category_infos,
+    group_documents,
     render_lathe_categories,
     render_lathe_category_prototypes,
     render_recipe_pack,
     render_starlight_documents,
     render_starlight_recipes,
 )
-from tools.verify_bundle import verify_bundle
+from tools.verify_bundle import (
+    _extract_documents,
+    _NotPlain,
+    _parse_ftl_keys,
+    _scan_document_events,
+    _scan_generated_sequence,
+    verify_bundle,
+)
 
 
 def write_paper(path: Path, title: str, body: str) -> None:
@@ -24,10 +34,14 @@ def write_paper(path: Path, title: str, body: str) -> None:
     path.write_text(f"# {title}\n{body}", encoding="utf-8")
 
 
-def _generate_bundle(tmp_path: Path) -> dict[str, Path]:
+def _generate_bundle(
+    tmp_path: Path,
+    identity_title: str = "ID Replacement",
+    security_title: str = "Incident Report",
+) -> dict[str, Path]:
     docs_dir = tmp_path / "docs"
-    write_paper(docs_dir / "Identity" / "id-replacement.paper", "ID Replacement", "[body]\n")
-    write_paper(docs_dir / "Security" / "incident.paper", "Incident Report", "[body]\n")
+    write_paper(docs_dir / "Identity" / "id-replacement.paper", identity_title, "[body]\n")
+    write_paper(docs_dir / "Security" / "incident.paper", security_title, "[body]\n")
 
     documents = discover_documents(docs_dir)
 
@@ -39,14 +53,14 @@ def _generate_bundle(tmp_path: Path) -> dict[str, Path]:
     write_output(render_documents_yaml(documents).rstrip("\n"), dist_dir / "documents.yml")
 
     categories = build_category_infos(documents, {})
+    groups = group_documents(documents, categories)
     write_output(
-        render_starlight_documents(documents, categories, hide_spawn_menu=True).rstrip("\n"),
+        render_starlight_documents(groups, hide_spawn_menu=True).rstrip("\n"),
         starlight_dir / "documents.yml",
     )
     write_output(
         render_starlight_recipes(
-            documents,
-            categories,
+            groups,
             recipe_categories={},
             completetime=2,
             materials={"SheetPrinter": 100},
@@ -55,7 +69,7 @@ def _generate_bundle(tmp_path: Path) -> dict[str, Path]:
         starlight_dir / "printer.yml",
     )
     write_output(
-        render_recipe_pack(documents, categories, pack_id="TestDocs").rstrip("\n"),
+        render_recipe_pack(groups, pack_id="TestDocs").rstrip("\n"),
         starlight_dir / "pack_docs.yml",
     )
     write_output(
@@ -82,6 +96,97 @@ def test_verify_bundle_accepts_valid_outputs(tmp_path: Path) -> None:
     paths = _generate_bundle(tmp_path)
     errors = verify_bundle(**paths)
     assert errors == []
+    assert verify_bundle(**paths, fast=True) == []
+
+
+@pytest.mark.parametrize(
+    "title",
+    ["Incident Report", "Incident #4 Report", "Report [Draft]", "Incident:Report", "Yes"],
+)
+def test_generated_scan_matches_yaml(tmp_path: Path, title: str) -> None:
+    paths = _generate_bundle(tmp_path, security_title=title)
+    for key in ("prototypes_path", "recipes_path", "pack_path", "category_prototypes_path"):
+        text = paths[key].read_text(encoding="utf-8")
+        scanned = _scan_generated_sequence(text)
+        if scanned is not None:
+            assert scanned == yaml.safe_load(text)
+    assert verify_bundle(**paths) == verify_bundle(**paths, fast=True) == []
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '  id: "IncidentRecipe"',
+        "  id: IncidentRecipe  # old",
+        "  - 'IncidentRecipe'",
+        "- {type: latheRecipe, id: IncidentRecipe}",
+        "  name: [Draft] Report",
+        "  name: yes",
+        "  components:\n    - type: Paper\n        content: k",
+        "-  type: entity",
+        "  name: a\x07b",
+        "  name: a\u2028b",
+    ],
+)
+def test_generated_scan_falls_back_outside_plain_scalars(line: str) -> None:
+    text = "# Auto-generated by tools/render_starlight.py.\n- type: latheRecipePack\n"
+    assert _scan_generated_sequence(text + line + "\n") is None
+
+
+def test_verify_bundle_rejects_invalid_yaml(tmp_path: Path) -> None:
+    paths = _generate_bundle(tmp_path, security_title="Incident: Report")
+    with pytest.raises(yaml.YAMLError):
+        verify_bundle(**paths)
+    with pytest.raises(yaml.YAMLError):
+        verify_bundle(**paths, fast=True)
+
+
+def _loaded_documents(text: str) -> tuple[set, set]:
+    entries = [entry for entry in yaml.safe_load(text)["documents"] if entry.get("key")]
+    categories = {category for entry in entries for category in entry.get("categories") or []}
+    return {entry["key"] for entry in entries}, categories
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # categories listed before key, and an entry without a key
+        "documents:\n  - categories: [CatA, CatB]\n    key: doc-a\n"
+        "  - name: No key\n    categories: [Ignored]\n",
+        # flow-style entries
+        'documents: [{key: doc-b, categories: [CatC]}, {categories: ["CatD"], key: "doc-c"}]\n',
+        # nested mappings inside an entry and beside the list
+        "meta:\n  source: docs\ndocuments:\n  - key: doc-d\n    extra:\n      nested: {a: 1}\n"
+        "      items: [x, y]\n    categories:\n      - CatE\n  - key: doc-e\n    categories: ~\n",
+    ],
+)
+def test_document_events_match_full_load(tmp_path: Path, text: str) -> None:
+    scanned = _scan_document_events(iter(yaml.parse(text)))
+    assert scanned == tuple(frozenset(values) for values in _loaded_documents(text))
+
+    path = tmp_path / "documents.yml"
+    path.write_text(text, encoding="utf-8")
+    assert _extract_documents(path) == scanned
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "documents:\n  - key: doc-a\n    categories: &c [CatA]\n"
+        "  - key: doc-b\n    categories: *c\n",
+        "documents:\n  - key: doc-a\n    categories: [&c CatA]\n"
+        "  - key: doc-b\n    categories: [*c]\n",
+        "documents:\n  - key: doc-a\n    categories: [CatA]\n    categories: [CatB]\n",
+    ],
+)
+def test_document_events_fall_back_to_full_load(tmp_path: Path, text: str) -> None:
+    with pytest.raises(_NotPlain):
+        _scan_document_events(iter(yaml.parse(text)))
+
+    path = tmp_path / "documents.yml"
+    path.write_text(text, encoding="utf-8")
+    expected = tuple(frozenset(values) for values in _loaded_documents(text))
+    assert _extract_documents(path) == expected
 
 
 def test_verify_bundle_detects_inconsistent_category(tmp_path: Path) -> None:
@@ -96,3 +201,46 @@ def test_verify_bundle_detects_inconsistent_category(tmp_path: Path) -> None:
     errors = verify_bundle(**paths)
     assert errors
     assert any("lathe recipes reference undefined categories" in error for error in errors)
+
+
+def test_parse_ftl_keys_ignores_comments_and_body_lines(tmp_path: Path) -> None:
+    ftl_path = tmp_path / "doc-printer.ftl"
+    ftl_path.write_text(
+        "# doc-text-printer-comment = no\n"
+        "doc-text-printer-a =\n"
+        "    doc-text-printer-body = no\n"
+        "doc-text-printer-b = value\n"
+        "lathe-category-other = no\n",
+        encoding="utf-8",
+    )
+
+    assert _parse_ftl_keys(ftl_path, "doc-text-printer-") == {
+        "doc-text-printer-a",
+        "doc-text-printer-b",
+    }
+
+
+def test_verify_bundle_scan_detects_unknown_recipe(tmp_path: Path) -> None:
+    paths = _generate_bundle(tmp_path)
+
+    pack_path = paths["pack_path"]
+    text = pack_path.read_text(encoding="utf-8")
+    pack_path.write_text(text.replace("IncidentRecipe", "MissingRecipe"), encoding="utf-8")
+
+    errors = verify_bundle(**paths, fast=True)
+    assert any("references unknown recipe" in error for error in errors)
+
+
+def test_verify_bundle_rereads_same_size_rewrite_with_same_mtime(tmp_path: Path) -> None:
+    paths = _generate_bundle(tmp_path)
+    assert verify_bundle(**paths) == []
+
+    pack_path = paths["pack_path"]
+    stat = pack_path.stat()
+    text = pack_path.read_text(encoding="utf-8")
+    pack_path.write_text(text.replace("IncidentRecipe", "IncidentRecipX"), encoding="utf-8")
+    os.utime(pack_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert pack_path.stat().st_size == stat.st_size
+
+    errors = verify_bundle(**paths)
+    assert any("references unknown recipe" in error for error in errors)
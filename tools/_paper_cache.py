@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Persist parsed document payloads between runs, keyed by file stat."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List
+
+CACHE_VERSION = 4
+
+CacheEntries = Dict[str, List[object]]
+
+
+def cache_path_for(root: Path, cache_dir: Path) -> Path:
+    """Return the cache file for a docs tree so separate trees never share entries."""
+    digest = hashlib.sha1(str(root.resolve()).encode("utf-8")).hexdigest()[:12]
+    return cache_dir / f".paperwork_cache-{digest}.json"
+
+
+def load_cache(path: Path) -> CacheEntries:
+    """Load cached entries, treating a missing, stale, or corrupt file as empty.
+
+    Only the top level is checked here; callers must treat each entry as untrusted.
+    """
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != CACHE_VERSION:
+        return {}
+    entries = raw.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return entries
+
+
+def save_cache(path: Path, entries: CacheEntries) -> None:
+    """Write cache entries, ignoring failures since the cache is only an optimisation."""
+    payload = json.dumps(
+        {"version": CACHE_VERSION, "entries": entries}, ensure_ascii=False
+    ).encode("utf-8")
+    try:
+        # Like write_output, leave an unchanged cache file alone.
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+    except OSError:
+        pass
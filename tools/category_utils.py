@@ -3,13 +3,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Set
 
 
-def alphabetic_suffix(index: int) -> str:
-    """Return an alphabetical suffix sequence (A, B, ..., Z, AA, AB, ...)."""
-    if index < 0:
-        raise ValueError("index must be non-negative")
+@lru_cache(maxsize=None)
+def _compute_suffix(index: int) -> str:
     result = ""
     value = index
     while True:
@@ -21,6 +20,19 @@ def alphabetic_suffix(index: int) -> str:
     return result
 
 
+# Every one- and two-letter suffix (A..ZZ); larger indices fall back to _compute_suffix.
+_SUFFIX_TABLE = tuple(_compute_suffix(index) for index in range(26 + 26 * 26))
+
+
+def alphabetic_suffix(index: int) -> str:
+    """Return an alphabetical suffix sequence (A, B, ..., Z, AA, AB, ...)."""
+    if index < 0:
+        raise ValueError("index must be non-negative")
+    if index < len(_SUFFIX_TABLE):
+        return _SUFFIX_TABLE[index]
+    return _compute_suffix(index)
+
+
 def ensure_document_slug(slug: str) -> str:
     """Ensure a slug is prefixed for document categories."""
     cleaned = slug.strip("-")
@@ -47,15 +59,16 @@ def allocate_slug(base: str, existing: Set[str], counters: Dict[str, int]) -> st
         counters.setdefault(base, 0)
         return key
 
+    # counters[base] is the next unused suffix for this base, so the first candidate is
+    # normally free; keep probing only when another base already claimed it.
     counter = counters.get(base, 0)
-    while True:
-        suffix = alphabetic_suffix(counter).lower()
-        candidate = f"{base}-{suffix}"
+    candidate = f"{base}-{alphabetic_suffix(counter).lower()}"
+    while candidate in existing:
         counter += 1
-        if candidate not in existing:
-            existing.add(candidate)
-            counters[base] = counter
-            return candidate
+        candidate = f"{base}-{alphabetic_suffix(counter).lower()}"
+    existing.add(candidate)
+    counters[base] = counter + 1
+    return candidate
 
 
 def allocate_id(base: str, existing: Set[str], counters: Dict[str, int]) -> str:
@@ -67,11 +80,10 @@ def allocate_id(base: str, existing: Set[str], counters: Dict[str, int]) -> str:
         return identifier
 
     counter = counters.get(base, 0)
-    while True:
-        suffix = alphabetic_suffix(counter)
-        candidate = f"{base}{suffix}"
+    candidate = f"{base}{alphabetic_suffix(counter)}"
+    while candidate in existing:
         counter += 1
-        if candidate not in existing:
-            existing.add(candidate)
-            counters[base] = counter
-            return candidate
+        candidate = f"{base}{alphabetic_suffix(counter)}"
+    existing.add(candidate)
+    counters[base] = counter + 1
+    return candidate
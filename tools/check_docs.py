@@ -4,49 +4,84 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import sys
-from collections import defaultdict
+from collections import Counter
 from pathlib import Path
 from typing import Iterable, List
 
-from render_ftl import PaperParseError, discover_documents
-
-
-def normalise_body(lines: Iterable[str]) -> str:
-    """Squash insignificant whitespace so duplicate forms are easier to spot."""
-    stripped = [line.strip() for line in lines if line.strip()]
-    return "\n".join(stripped)
-
-
-def check_documents(docs_dir: Path, strict_stamps: bool, fail_on_duplicates: bool) -> int:
+from render_ftl import (
+    DEFAULT_CACHE_DIR,
+    PaperParseError,
+    discover_documents,
+    load_document_cache,
+    save_cache,
+)
+
+
+def body_digest(lines: Iterable[str]) -> bytes | None:
+    """Hash the non-blank, whitespace-trimmed lines so duplicate forms are easier to spot.
+
+    Returns ``None`` when the body has no content.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    seen_any = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped:
+            digest.update(stripped.encode("utf-8"))
+            digest.update(b"\n")
+            seen_any = True
+    return digest.digest() if seen_any else None
+
+
+def check_documents(
+    docs_dir: Path,
+    strict_stamps: bool,
+    fail_on_duplicates: bool,
+    cache_dir: Path | None = None,
+) -> int:
+    cache_path, cache = load_document_cache(docs_dir, cache_dir)
     try:
-        documents = discover_documents(docs_dir)
+        documents = discover_documents(docs_dir, cache)
     except PaperParseError as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 2
+    if cache_path is not None:
+        save_cache(cache_path, cache)
 
-    duplicate_map: dict[str, List[str]] = defaultdict(list)
     missing_stamp: List[str] = []
+    body_keys: List[bytes | None] = []
 
+    # Count digests first so path lists are only built for bodies that actually repeat.
+    body_counts: Counter[bytes] = Counter()
     for doc in documents:
-        body_key = normalise_body(doc.body_lines)
-        if body_key:
-            duplicate_map[body_key].append(str(doc.path.relative_to(docs_dir)))
+        body_key = body_digest(doc.body_lines)
+        body_keys.append(body_key)
+        if body_key is not None:
+            body_counts[body_key] += 1
 
         has_stamp = any("stamp" in line.lower() for line in doc.body_lines)
         if not has_stamp:
             missing_stamp.append(str(doc.path.relative_to(docs_dir)))
 
+    duplicate_map: dict[bytes, List[str]] = {
+        key: [] for key, count in body_counts.items() if count > 1
+    }
+    if duplicate_map:
+        for doc, body_key in zip(documents, body_keys):
+            if body_key in duplicate_map:
+                duplicate_map[body_key].append(str(doc.path.relative_to(docs_dir)))
+
     warnings: List[str] = []
     errors: List[str] = []
 
     for docs in duplicate_map.values():
-        if len(docs) > 1:
-            message = "duplicate body content across: " + ", ".join(sorted(docs))
-            if fail_on_duplicates:
-                errors.append(message)
-            else:
-                warnings.append(message)
+        message = "duplicate body content across: " + ", ".join(sorted(docs))
+        if fail_on_duplicates:
+            errors.append(message)
+        else:
+            warnings.append(message)
 
     if missing_stamp:
         message = "missing possible stamp area: " + ", ".join(sorted(missing_stamp))
@@ -82,6 +117,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Treat duplicate body content as an error instead of a warning.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every document instead of reusing the parse cache in dist/.",
+    )
     return parser
 
 
@@ -89,7 +129,12 @@ def main(argv: List[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    return check_documents(args.docs_dir, args.strict_stamps, args.fail_on_duplicates)
+    return check_documents(
+        args.docs_dir,
+        args.strict_stamps,
+        args.fail_on_duplicates,
+        None if args.no_cache else DEFAULT_CACHE_DIR,
+    )
 
 
 if __name__ == "__main__":
@@ -4,17 +4,34 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
 if __package__:
+    from ._paper_cache import CacheEntries, cache_path_for, load_cache, save_cache
     from .category_utils import allocate_id, allocate_slug, ensure_document_id, ensure_document_slug
 else:
+    from _paper_cache import CacheEntries, cache_path_for, load_cache, save_cache
     from category_utils import allocate_id, allocate_slug, ensure_document_id, ensure_document_slug
 
 FTL_PREFIX_MARKER = "\u200b"  # zero-width space to avoid Fluent select parsing
+# Both suffixes are live: the checked-in tree is .txt, new forms may use .paper. A single
+# tuple endswith during the scandir walk matches either at no extra cost.
+DOCUMENT_SUFFIXES = (".paper", ".txt")
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / "dist"
+
+_CATEGORY_CACHE: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+_RE_PAREN = re.compile(r"\s*\([^()]*\)")
+_RE_WS = re.compile(r"\s+")
+_RE_DIGITS = re.compile(r"\d+")
+_RE_SPLIT_NONALNUM = re.compile(r"[^0-9a-zA-Z]+")
+_RE_NUM_PREFIX = re.compile(r"^\d+\s*[-.)]?\s*")
 
 
 class PaperParseError(RuntimeError):
@@ -23,51 +40,63 @@ class PaperParseError(RuntimeError):
 
 def strip_parenthetical(text: str) -> str:
     """Remove parenthetical segments and collapse surrounding whitespace."""
-    without_parentheses = re.sub(r"\s*\([^()]*\)", "", text)
-    collapsed = re.sub(r"\s+", " ", without_parentheses)
+    without_parentheses = _RE_PAREN.sub("", text)
+    collapsed = _RE_WS.sub(" ", without_parentheses)
     return collapsed.strip()
 
 
 def normalise_component(component: str) -> str:
     """Produce a filesystem/path-safe slug component."""
-    cleaned = strip_parenthetical(component)
-    cleaned = cleaned.lower().replace(" ", "-")
-    cleaned = re.sub(r"[^a-z0-9-]+", "-", cleaned)
-    cleaned = re.sub(r"\d+", "", cleaned)
-    cleaned = re.sub(r"-+", "-", cleaned).strip("-")
-    return cleaned
+    # Single pass equivalent to: non-[a-z0-9] runs -> "-", drop digits, collapse and trim dashes.
+    out: List[str] = []
+    pending_dash = False
+    for ch in strip_parenthetical(component).lower():
+        if "a" <= ch <= "z":
+            if pending_dash and out:
+                out.append("-")
+            pending_dash = False
+            out.append(ch)
+        elif "0" <= ch <= "9":
+            continue
+        else:
+            pending_dash = True
+    return "".join(out)
 
 
 def clean_category_label(component: str) -> str:
     """Return a human-readable category label without parenthetical notes."""
     cleaned = strip_parenthetical(component).strip()
-    without_prefix = re.sub(r"^\d+\s*[-.)]?\s*", "", cleaned)
+    without_prefix = _RE_NUM_PREFIX.sub("", cleaned)
     result = without_prefix.strip()
     return result or cleaned
 
 
 def to_pascal_case(value: str) -> str:
     """Convert a string into PascalCase segments."""
-    parts = re.split(r"[^0-9a-zA-Z]+", value)
+    parts = _RE_SPLIT_NONALNUM.split(value)
     result_parts: List[str] = []
     for part in parts:
         if not part:
             continue
         if part.isdigit():
             continue
-        stripped = re.sub(r"\d+", "", part)
+        stripped = _RE_DIGITS.sub("", part)
         if not stripped:
             continue
         result_parts.append(stripped[0].upper() + stripped[1:].lower())
     return "".join(result_parts)
 
 
+_YAML_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def yaml_quote(value: str) -> str:
-    escaped = value.replace("\\", "\\\\").replace("\"", "\\\"")
-    return f'"{escaped}"'
+    if "\\" in value or '"' in value:
+        return f'"{value.translate(_YAML_ESCAPE)}"'
+    return f'"{value}"'
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PaperDocument:
     path: Path
     categories: Tuple[str, ...]
@@ -75,54 +104,160 @@ class PaperDocument:
     slug: str
     slug_key: str
     title: str
-    body_lines: List[str]
-
-    @property
-    def category_label(self) -> str:
-        if not self.categories:
-            return "uncategorized"
-        return " / ".join(self.categories)
-
-    @property
-    def fluent_key(self) -> str:
-        parts = [*self.category_keys, self.slug_key]
-        filtered = [part for part in parts if part]
+    body_lines: Tuple[str, ...]
+    # Derived once in __post_init__; renderers read these for every document.
+    category_label: str = field(init=False, repr=False, compare=False)
+    fluent_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        category_label = " / ".join(self.categories) if self.categories else "uncategorized"
+        filtered = [part for part in (*self.category_keys, self.slug_key) if part]
         suffix = "-".join(filtered) if filtered else "paper"
-        return f"doc-text-printer-{suffix}"
+        object.__setattr__(self, "category_label", category_label)
+        object.__setattr__(self, "fluent_key", sys.intern(f"doc-text-printer-{suffix}"))
+
+
+def _walk(root: Path) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+    """Yield ``(path, parent_parts)`` for documents under ``root`` in one scandir pass.
+
+    ``parent_parts`` are the directory names between ``root`` and the file, accumulated
+    during traversal so callers never need ``Path.relative_to``. Entries prefixed with
+    ``_`` are pruned.
+    """
+    stack: List[Tuple[str, Tuple[str, ...]]] = [(str(root), ())]
+    while stack:
+        directory, parts = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("_"):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, (*parts, entry.name)))
+                elif entry.name.endswith(DOCUMENT_SUFFIXES):
+                    yield entry.path, parts
+
+
+def _list_documents(root: Path) -> List[Tuple[Path, Tuple[str, ...]]]:
+    if not root.is_dir():
+        return []
+    return sorted((Path(path), parts) for path, parts in _walk(root))
 
 
 def list_document_paths(root: Path) -> List[Path]:
-    candidates: set[Path] = set()
-    for pattern in ("*.txt", "*.paper"):
-        for path in root.rglob(pattern):
-            candidates.add(path)
-
-    paths: List[Path] = []
-    for path in sorted(candidates):
-        if should_skip(path, root):
-            continue
-        paths.append(path)
-    return paths
+    return [path for path, _ in _list_documents(root)]
+
+
+def discover_documents(root: Path, cache: CacheEntries | None = None) -> List[PaperDocument]:
+    """Parse every document under ``root``.
+
+    When ``cache`` is given, documents whose mtime and size match a cached entry are
+    rebuilt from it instead of being re-read, and the mapping is updated in place to
+    hold exactly the documents seen in this run.
+
+    The result is sorted by ``(categories, slug)``, which the renderers rely on.
+    """
+    entries = _list_documents(root)
+    paths = [path for path, _ in entries]
+    if not paths:
+        suffixes = "/".join(DOCUMENT_SUFFIXES)
+        raise PaperParseError(f"No {suffixes} documents found under {root}")
+
+    slots: List[PaperDocument | None] = [None] * len(paths)
+    stats: List[os.stat_result | None] = [None] * len(paths)
+    pending: List[int] = []
+    for index, path in enumerate(paths):
+        if cache is not None:
+            stat = stats[index] = os.stat(path)
+            cached = cache.get(str(path))
+            if cached is not None:
+                document = _document_from_cache(path, entries[index][1], cached, stat)
+                if document is not None:
+                    slots[index] = document
+                    continue
+        pending.append(index)
+
+    # Parsing is CPU-bound under the GIL, so a thread pool only adds overhead here.
+    for index in pending:
+        path, raw_categories = entries[index]
+        slots[index] = parse_document(path, root, raw_categories)
+    documents: List[PaperDocument] = slots  # type: ignore[assignment]
+
+    if cache is not None:
+        cache.clear()
+        for path, stat, document in zip(paths, stats, documents):
+            cache[str(path)] = [stat.st_mtime_ns, stat.st_size, _document_payload(document)]
+    documents.sort(key=lambda doc: (doc.categories, doc.slug))
+    return documents
+
+
+def _document_payload(doc: PaperDocument) -> Dict[str, object]:
+    return {
+        "slug": doc.slug,
+        "slug_key": doc.slug_key,
+        "title": doc.title,
+        "body_lines": doc.body_lines,
+    }
 
 
-def should_skip(path: Path, root: Path) -> bool:
+def _document_from_cache(
+    path: Path, raw_categories: Tuple[str, ...], cached: object, stat: os.stat_result
+) -> PaperDocument | None:
+    """Rebuild a document from its cache entry, or return ``None`` if it is stale or malformed."""
     try:
-        relative_parts = path.relative_to(root).parts
-    except ValueError:
-        return True
-    return any(part.startswith("_") for part in relative_parts)
-
-
-def discover_documents(root: Path) -> List[PaperDocument]:
-    documents: List[PaperDocument] = []
-    for path in list_document_paths(root):
-        documents.append(parse_document(path, root))
-    if not documents:
-        raise PaperParseError(f"No .paper documents found under {root}")
-    return documents
+        mtime_ns, size, payload = cached  # type: ignore[misc]
+        if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+            return None
+        slug, slug_key, title = payload["slug"], payload["slug_key"], payload["title"]
+        body_lines = payload["body_lines"]
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not isinstance(body_lines, (list, tuple)) or not all(
+        isinstance(value, str) for value in (slug, slug_key, title, *body_lines)
+    ):
+        return None
+    display_categories, category_keys = category_tuples(raw_categories)
+    return PaperDocument(
+        path=path,
+        categories=display_categories,
+        category_keys=category_keys,
+        slug=slug,
+        slug_key=slug_key,
+        title=title,
+        body_lines=tuple(body_lines),
+    )
 
 
-def parse_document(path: Path, root: Path) -> PaperDocument:
+def load_document_cache(root: Path, cache_dir: Path | None) -> Tuple[Path | None, CacheEntries | None]:
+    """Return the cache file and its entries for ``root``, or ``(None, None)`` when disabled."""
+    if cache_dir is None:
+        return None, None
+    cache_path = cache_path_for(root, cache_dir)
+    return cache_path, load_cache(cache_path)
+
+
+def category_tuples(raw_categories: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return ``(display, keys)`` category tuples for a document directory.
+
+    Results are memoised per directory so every document in it shares the same interned
+    tuple objects, letting sort comparisons short-circuit on identity.
+    """
+    cached = _CATEGORY_CACHE.get(raw_categories)
+    if cached is None:
+        display_categories = tuple(
+            sys.intern(label)
+            for label in filter(None, (clean_category_label(part) for part in raw_categories))
+        )
+        category_keys = tuple(
+            sys.intern(key)
+            for key in filter(None, (normalise_component(part) for part in display_categories))
+        )
+        cached = _CATEGORY_CACHE.setdefault(raw_categories, (display_categories, category_keys))
+    return cached
+
+
+def parse_document(
+    path: Path, root: Path, raw_categories: Tuple[str, ...] | None = None
+) -> PaperDocument:
     try:
         raw_text = path.read_text(encoding="utf-8")
     except FileNotFoundError as exc:
@@ -131,8 +266,11 @@ def parse_document(path: Path, root: Path) -> PaperDocument:
     if not raw_text.strip():
         raise PaperParseError(f"Document {path} is empty")
 
-    normalised = raw_text.replace("\r\n", "\n").replace("\r", "\n")
-    lines = normalised.split("\n")
+    # read_text() already folds CRLF and CR into "\n"; split on that alone so form feeds,
+    # U+2028 and other str.splitlines() boundaries stay inside a body line.
+    lines = raw_text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
 
     if not lines or not lines[0].lstrip().startswith("#"):
         raise PaperParseError(
@@ -143,20 +281,16 @@ def parse_document(path: Path, root: Path) -> PaperDocument:
     if not title_line:
         raise PaperParseError(f"Title line in {path} is empty")
 
-    body_lines = lines[1:]
+    body_lines = tuple(lines[1:])
 
-    raw_categories = path.relative_to(root).parent.parts
-    display_categories = tuple(
-        filter(None, (clean_category_label(part) for part in raw_categories))
-    )
-    category_keys = tuple(
-        filter(None, (normalise_component(part) for part in display_categories))
-    )
+    if raw_categories is None:
+        raw_categories = path.relative_to(root).parent.parts
+    display_categories, category_keys = category_tuples(raw_categories)
 
     slug = path.stem
     slug_key = normalise_component(slug)
     if not slug_key:
-        fallback = re.sub(r"\d+", "", slug.lower())
+        fallback = _RE_DIGITS.sub("", slug.lower())
         slug_key = fallback or "document"
 
     return PaperDocument(
@@ -171,44 +305,40 @@ def parse_document(path: Path, root: Path) -> PaperDocument:
 
 
 def render_ftl(documents: Iterable[PaperDocument]) -> str:
-    docs = sorted(documents, key=lambda doc: (doc.categories, doc.slug))
-
-    lines: List[str] = []
-    lines.append("# Auto-generated by tools/render_ftl.py. Do not edit manually.")
-    lines.append("# Source docs: docs/*.txt")
+    """Render the Fluent bundle; input must be pre-sorted by ``(categories, slug)``."""
+    # Encode straight into one buffer instead of collecting per-document strings to join.
+    out = bytearray()
+    push = out.extend
+    push(b"# Auto-generated by tools/render_ftl.py. Do not edit manually.\n# Source docs: docs/*.txt\n")
 
     current_category: Tuple[str, ...] | None = None
-    for doc in docs:
+    for doc in documents:
         if doc.categories != current_category:
-            lines.append("")
-            lines.append(f"# {doc.category_label}")
+            push(f"\n# {doc.category_label}\n".encode("utf-8"))
             current_category = doc.categories
 
-        lines.append("")
-        lines.append(f"# title: {doc.title}")
-        lines.append(f"# slug: {doc.slug}")
-        lines.append(f"{doc.fluent_key} =")
-        body_lines = list(doc.body_lines)
-        while body_lines and not body_lines[-1].strip():
-            body_lines.pop()
-        if body_lines:
-            for raw_line in body_lines:
-                formatted_line = raw_line
-                if formatted_line.startswith("["):
-                    # Fluent treats lines beginning with '[' as select variants. Prefix a zero-width
-                    # space so the document renders while preserving legacy markup.
-                    formatted_line = FTL_PREFIX_MARKER + formatted_line
-                lines.append(f"    {formatted_line}")
+        body_lines = doc.body_lines
+        end = len(body_lines)
+        while end and not body_lines[end - 1].strip():
+            end -= 1
+        # Fluent treats lines beginning with '[' as select variants. Prefix a zero-width
+        # space so the document renders while preserving legacy markup.
+        body = "".join(
+            f"    {FTL_PREFIX_MARKER}{raw_line}\n" if raw_line.startswith("[") else f"    {raw_line}\n"
+            for raw_line in islice(body_lines, end)
+        )
         # Always add trailing blank lines so in-game rendering gets vertical spacing.
-        lines.append(f"    {FTL_PREFIX_MARKER}")
-        lines.append(f"    {FTL_PREFIX_MARKER}")
-    lines.append("")
-    return "\n".join(lines)
+        push(
+            (
+                f"\n# title: {doc.title}\n# slug: {doc.slug}\n{doc.fluent_key} =\n{body}"
+                f"    {FTL_PREFIX_MARKER}\n    {FTL_PREFIX_MARKER}\n"
+            ).encode("utf-8")
+        )
+    return out.decode("utf-8")
 
 
 def render_documents_yaml(documents: Iterable[PaperDocument]) -> str:
-    docs = sorted(documents, key=lambda doc: (doc.categories, doc.slug))
-
+    """Render documents.yml metadata; input must be pre-sorted by ``(categories, slug)``."""
     lines: List[str] = []
     lines.append("# Auto-generated by tools/render_ftl.py. Do not edit manually.")
     lines.append("documents:")
@@ -234,26 +364,28 @@ def render_documents_yaml(documents: Iterable[PaperDocument]) -> str:
         category_id_map[category] = identifier
         return identifier
 
-    for doc in docs:
-        lines.append("  - key: " + yaml_quote(doc.fluent_key))
-        lines.append("    name: " + yaml_quote(doc.title))
+    for doc in documents:
+        entry = f"  - key: {yaml_quote(doc.fluent_key)}\n    name: {yaml_quote(doc.title)}"
         if doc.categories:
-            primary_category = doc.categories[0]
-            category_value = ensure_category_id(primary_category)
-            lines.append("    categories:")
-            lines.append("      - " + yaml_quote(category_value))
+            category_value = ensure_category_id(doc.categories[0])
+            entry += f"\n    categories:\n      - {yaml_quote(category_value)}"
+        lines.append(entry)
     lines.append("")
     return "\n".join(lines)
 
 
 def write_output(content: str, destination: Path) -> bool:
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    new_text = content + "\n"
-    if destination.exists():
-        current_text = destination.read_text(encoding="utf-8")
-        if current_text == new_text:
+    new_bytes = (content + "\n").encode("utf-8")
+    try:
+        current_size = destination.stat().st_size
+    except FileNotFoundError:
+        pass
+    else:
+        # A size mismatch already proves the content changed, so only read on equal sizes.
+        if current_size == len(new_bytes) and destination.read_bytes() == new_bytes:
             return False
-    destination.write_text(new_text, encoding="utf-8")
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_bytes(new_bytes)
     return True
 
 
@@ -277,6 +409,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=Path(__file__).resolve().parents[1] / "dist" / "documents.yml",
         help="Destination path for the generated documents metadata",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every document instead of reusing the parse cache in dist/",
+    )
     return parser
 
 
@@ -285,7 +422,10 @@ def main(argv: List[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     try:
-        documents = discover_documents(args.docs_dir)
+        cache_path, cache = load_document_cache(
+            args.docs_dir, None if args.no_cache else DEFAULT_CACHE_DIR
+        )
+        documents = discover_documents(args.docs_dir, cache)
         ftl_output = render_ftl(documents)
         yaml_output = render_documents_yaml(documents)
         ftl_changed = write_output(ftl_output, args.output)
@@ -309,6 +449,8 @@ def main(argv: List[str] | None = None) -> int:
         )
         if not targets:
             targets = f"{args.output}, {args.documents_output}"
+        if cache_path is not None:
+            save_cache(cache_path, cache)
         print(f"{status} {targets} from {len(documents)} document(s).")
         return 0
     except PaperParseError as exc:
@@ -5,20 +5,26 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from io import StringIO
 from pathlib import Path
 import sys
-from typing import Dict, List, Mapping, MutableMapping, Sequence
+from typing import Dict, List, Mapping, NamedTuple, Sequence, Tuple
 
 if __package__:
     from .category_utils import allocate_id, allocate_slug, ensure_document_id, ensure_document_slug
     from .render_ftl import (
+        DEFAULT_CACHE_DIR,
         PaperDocument,
         PaperParseError,
         discover_documents,
+        load_document_cache,
         normalise_component,
         render_documents_yaml,
         render_ftl as render_ftl_bundle,
+        save_cache,
         to_pascal_case,
         write_output,
     )
@@ -31,21 +37,55 @@ else:
         sys.path.insert(0, str(PARENT_DIR))
     from category_utils import allocate_id, allocate_slug, ensure_document_id, ensure_document_slug
     from render_ftl import (
+        DEFAULT_CACHE_DIR,
         PaperDocument,
         PaperParseError,
         discover_documents,
+        load_document_cache,
         normalise_component,
         render_documents_yaml,
         render_ftl as render_ftl_bundle,
+        save_cache,
         to_pascal_case,
         write_output,
     )
 
 ST_DEFAULT_MATERIALS = {"SheetPrinter": 100}
-
-
-@dataclass(slots=True)
-class CategoryInfo:
+GENERATED_HEADER = "# Auto-generated by tools/render_starlight.py. Do not edit manually."
+
+# Per-document output blocks, bound to str.format once at import.
+_ENTITY_TEMPLATE = (
+    "- type: entity\n"
+    "  parent: PrintedDocument\n"
+    "  id: {id}\n"
+    "  name: {name}\n"
+    "{hide}"
+    "  components:\n"
+    "    - type: Paper\n"
+    "      content: {key}\n"
+    "\n"
+).format
+_RECIPE_TEMPLATE = (
+    "- type: latheRecipe\n"
+    "  id: {id}\n"
+    "  result: {result}\n"
+    "  categories:\n"
+    "    - {category}\n"
+    "  completetime: {completetime}\n"
+    "  applyMaterialDiscount: {discount}\n"
+    "  materials:\n"
+    "{materials}"
+    "\n"
+).format
+_PACK_ENTRY_TEMPLATE = "  - {id}\n".format
+_HIDE_SPAWN_MENU = "  categories: [ HideSpawnMenu ]\n"
+
+# Pure string helpers called repeatedly on the same category labels and fluent keys.
+_pascal = lru_cache(maxsize=None)(to_pascal_case)
+_normalise = lru_cache(maxsize=None)(normalise_component)
+
+
+class CategoryInfo(NamedTuple):
     """Describe how a paperwork category maps onto Starlight assets."""
 
     raw_label: str
@@ -56,6 +96,19 @@ class CategoryInfo:
     order: int
 
 
+@dataclass(slots=True, frozen=True)
+class ResolvedDocument:
+    """A paperwork document with its Starlight ids resolved once for all renderers."""
+
+    doc: PaperDocument
+    entity_id: str
+    recipe_id: str
+
+
+# A category with its documents in title order.
+DocumentGroup = Tuple[CategoryInfo, List[ResolvedDocument]]
+
+
 def primary_category(doc: PaperDocument) -> str:
     """Return the primary (top-level) category label for a paperwork document."""
     if doc.categories:
@@ -63,6 +116,12 @@ def primary_category(doc: PaperDocument) -> str:
     return "Miscellaneous"
 
 
+def primary_categories(documents: Sequence[PaperDocument]) -> List[str]:
+    """Return ``primary_category`` for each document, index-aligned with ``documents``."""
+    # Interned because these labels are the dict keys group_documents buckets and probes by.
+    return [sys.intern(primary_category(doc)) for doc in documents]
+
+
 def load_category_overrides(path: Path | None) -> Dict[str, Dict[str, object]]:
     """Read optional JSON category overrides keyed by the primary category label."""
     if path is None:
@@ -86,8 +145,15 @@ def load_category_overrides(path: Path | None) -> Dict[str, Dict[str, object]]:
 def build_category_infos(
     documents: Sequence[PaperDocument],
     overrides: Mapping[str, Dict[str, object]],
+    primaries: Sequence[str] | None = None,
 ) -> List[CategoryInfo]:
-    """Construct ordered category metadata derived from discovered documents."""
+    """Construct ordered category metadata derived from discovered documents.
+
+    ``primaries`` may carry precomputed ``primary_categories(documents)`` to share with
+    ``group_documents``.
+    """
+    if primaries is None:
+        primaries = primary_categories(documents)
     infos: Dict[str, CategoryInfo] = {}
     existing_keys: set[str] = set()
     key_counters: Dict[str, int] = {}
@@ -95,8 +161,9 @@ def build_category_infos(
     id_counters: Dict[str, int] = {}
     order_counter = 0
 
-    for doc in documents:
-        category = primary_category(doc)
+    # Default ordering follows the on-disk layout (e.g. numbered folders), not the
+    # label-sorted order documents arrive in.
+    for _, category in sorted(zip(documents, primaries), key=lambda pair: pair[0].path):
         if category in infos:
             continue
 
@@ -105,13 +172,13 @@ def build_category_infos(
 
         lathe_key_override = override.get("lathe_key")
         if isinstance(lathe_key_override, str) and lathe_key_override.strip():
-            override_slug = normalise_component(lathe_key_override)
+            override_slug = _normalise(lathe_key_override)
         else:
             override_slug = ""
         base_slug = (
             override_slug
-            or normalise_component(lathe_label)
-            or normalise_component(category)
+            or _normalise(lathe_label)
+            or _normalise(category)
             or "misc"
         )
         base_slug = ensure_document_slug(base_slug)
@@ -121,10 +188,10 @@ def build_category_infos(
         if isinstance(lathe_id_override, str) and lathe_id_override.strip():
             base_id_source = lathe_id_override.strip()
         else:
-            base_id_source = to_pascal_case(lathe_label) or to_pascal_case(category)
+            base_id_source = _pascal(lathe_label) or _pascal(category)
 
         if not base_id_source:
-            base_id_source = to_pascal_case(category) or "Category"
+            base_id_source = _pascal(category) or "Category"
         base_id = ensure_document_id(base_id_source)
         lathe_id = allocate_id(base_id, existing_ids, id_counters)
 
@@ -154,14 +221,18 @@ def build_category_infos(
 
 def entity_id_for(doc: PaperDocument) -> str:
     """Derive the Starlight entity id for a paperwork document."""
-    key = doc.fluent_key
+    return _entity_id_for_key(doc.fluent_key)
+
+
+@lru_cache(maxsize=None)
+def _entity_id_for_key(key: str) -> str:
     prefix = "doc-text-printer-"
     if key.startswith(prefix):
         key = key[len(prefix) :]
     components = [part for part in key.split("-") if part]
     filtered = [part for part in components if not part.isdigit()]
     filtered_key = "-".join(filtered) if filtered else key
-    suffix = to_pascal_case(filtered_key)
+    suffix = _pascal(filtered_key)
     return f"PrintedDocument{suffix}"
 
 
@@ -170,149 +241,135 @@ def recipe_id_for(entity_id: str) -> str:
     return f"{entity_id}Recipe"
 
 
-def render_starlight_documents(
+def group_documents(
     documents: Sequence[PaperDocument],
     categories: Sequence[CategoryInfo],
-    hide_spawn_menu: bool,
-) -> str:
-    """Render the entity prototypes for the provided paperwork documents."""
-    by_category: MutableMapping[str, List[PaperDocument]] = {}
-    for doc in documents:
-        category = primary_category(doc)
+    primaries: Sequence[str] | None = None,
+) -> List[DocumentGroup]:
+    """Group documents by category in output order, each sorted by title.
+
+    Entity and recipe ids are resolved here once per document so the renderers only
+    look them up.
+    Categories without documents are omitted.
+    """
+    if primaries is None:
+        primaries = primary_categories(documents)
+    # One title sort before bucketing leaves every bucket in title order, so each title is
+    # casefolded once and no per-category sort is needed. Equal titles fall back to path
+    # order, since documents arrive sorted by (categories, slug) rather than by path.
+    by_category: Dict[str, List[PaperDocument]] = {}
+    for doc, category in sorted(
+        zip(documents, primaries), key=lambda pair: (pair[0].title.casefold(), pair[0].path)
+    ):
         by_category.setdefault(category, []).append(doc)
 
-    header = "# Auto-generated by tools/render_starlight.py. Do not edit manually."
-    lines: List[str] = [header]
-
+    groups: List[DocumentGroup] = []
     for info in categories:
         docs = by_category.get(info.raw_label)
         if not docs:
             continue
-        docs_sorted = sorted(docs, key=lambda doc: doc.title.casefold())
+        entries: List[ResolvedDocument] = []
+        for doc in docs:
+            entity_id = entity_id_for(doc)
+            entries.append(ResolvedDocument(doc, entity_id, recipe_id_for(entity_id)))
+        groups.append((info, entries))
+    return groups
 
-        lines.append("")
-        lines.append(f"# {info.comment}")
-        lines.append("")
 
-        for doc in docs_sorted:
-            entity_id = entity_id_for(doc)
-            lines.append("- type: entity")
-            lines.append("  parent: PrintedDocument")
-            lines.append(f"  id: {entity_id}")
-            lines.append(f"  name: {doc.title}")
-            if hide_spawn_menu:
-                lines.append("  categories: [ HideSpawnMenu ]")
-            lines.append("  components:")
-            lines.append("    - type: Paper")
-            lines.append(f"      content: {doc.fluent_key}")
-            lines.append("")
+def render_starlight_documents(groups: Sequence[DocumentGroup], hide_spawn_menu: bool) -> str:
+    """Render the entity prototypes for the provided paperwork documents."""
+    buf = StringIO()
+    write = buf.write
+    write(GENERATED_HEADER + "\n")
 
-    return "\n".join(lines).rstrip() + "\n"
+    for info, entries in groups:
+        write(f"\n# {info.comment}\n\n")
+        for entry in entries:
+            write(
+                _ENTITY_TEMPLATE(
+                    id=entry.entity_id,
+                    name=entry.doc.title,
+                    hide=_HIDE_SPAWN_MENU if hide_spawn_menu else "",
+                    key=entry.doc.fluent_key,
+                )
+            )
+
+    return buf.getvalue().rstrip() + "\n"
 
 
 def render_starlight_recipes(
-    documents: Sequence[PaperDocument],
-    categories: Sequence[CategoryInfo],
+    groups: Sequence[DocumentGroup],
     recipe_categories: Mapping[str, str],
     completetime: int,
     materials: Mapping[str, int],
     apply_discount: bool,
 ) -> str:
     """Render lathe recipe prototypes for paperwork documents."""
-    by_category: MutableMapping[str, List[PaperDocument]] = {}
-    for doc in documents:
-        category = primary_category(doc)
-        by_category.setdefault(category, []).append(doc)
-
-    header = "# Auto-generated by tools/render_starlight.py. Do not edit manually."
-    lines: List[str] = [header]
+    # Identical for every recipe, so format them once up front.
+    discount = "true" if apply_discount else "false"
+    materials_block = "".join(f"    {material}: {amount}\n" for material, amount in materials.items())
 
-    for info in categories:
-        docs = by_category.get(info.raw_label)
-        if not docs:
-            continue
-        docs_sorted = sorted(docs, key=lambda doc: doc.title.casefold())
-        lines.append("")
-        lines.append(f"# {info.comment}")
-        lines.append("")
+    buf = StringIO()
+    write = buf.write
+    write(GENERATED_HEADER + "\n")
 
+    for info, entries in groups:
+        write(f"\n# {info.comment}\n\n")
         lathe_category_id = recipe_categories.get(info.raw_label, info.lathe_id)
 
-        for doc in docs_sorted:
-            entity_id = entity_id_for(doc)
-            recipe_id = recipe_id_for(entity_id)
-            lines.append("- type: latheRecipe")
-            lines.append(f"  id: {recipe_id}")
-            lines.append(f"  result: {entity_id}")
-            lines.append("  categories:")
-            lines.append(f"    - {lathe_category_id}")
-            lines.append(f"  completetime: {completetime}")
-            lines.append(f"  applyMaterialDiscount: {str(apply_discount).lower()}")
-            lines.append("  materials:")
-            for material, amount in materials.items():
-                lines.append(f"    {material}: {amount}")
-            lines.append("")
-
-    return "\n".join(lines).rstrip() + "\n"
-
-
-def render_recipe_pack(
-    documents: Sequence[PaperDocument],
-    categories: Sequence[CategoryInfo],
-    pack_id: str,
-) -> str:
-    """Render the lathe recipe pack block wiring paperwork recipes together."""
-    by_category: MutableMapping[str, List[PaperDocument]] = {}
-    for doc in documents:
-        category = primary_category(doc)
-        by_category.setdefault(category, []).append(doc)
+        for entry in entries:
+            write(
+                _RECIPE_TEMPLATE(
+                    id=entry.recipe_id,
+                    result=entry.entity_id,
+                    category=lathe_category_id,
+                    completetime=completetime,
+                    discount=discount,
+                    materials=materials_block,
+                )
+            )
 
-    header = "# Auto-generated by tools/render_starlight.py. Do not edit manually."
-    lines: List[str] = [header]
-    lines.append(f"- type: latheRecipePack")
-    lines.append(f"  id: {pack_id}")
-    lines.append("  recipes:")
+    return buf.getvalue().rstrip() + "\n"
 
-    for info in categories:
-        docs = by_category.get(info.raw_label)
-        if not docs:
-            continue
-        docs_sorted = sorted(docs, key=lambda doc: doc.title.casefold())
-        lines.append(f"  # {info.comment}")
-        for doc in docs_sorted:
-            entity_id = entity_id_for(doc)
-            recipe_id = recipe_id_for(entity_id)
-            lines.append(f"  - {recipe_id}")
-        lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+def render_recipe_pack(groups: Sequence[DocumentGroup], pack_id: str) -> str:
+    """Render the lathe recipe pack block wiring paperwork recipes together."""
+    buf = StringIO()
+    write = buf.write
+    write(GENERATED_HEADER + "\n")
+    write(f"- type: latheRecipePack\n  id: {pack_id}\n  recipes:\n")
+
+    for info, entries in groups:
+        write(f"  # {info.comment}\n")
+        for entry in entries:
+            write(_PACK_ENTRY_TEMPLATE(id=entry.recipe_id))
+        write("\n")
+
+    return buf.getvalue().rstrip() + "\n"
 
 
 def render_lathe_categories(categories: Sequence[CategoryInfo]) -> str:
     """Render Fluent lathe category entries."""
-    header = "# Auto-generated by tools/render_starlight.py. Do not edit manually."
-    lines: List[str] = [header]
+    buf = StringIO()
+    write = buf.write
+    write(GENERATED_HEADER + "\n")
 
     for info in categories:
-        lines.append(f"lathe-category-{info.lathe_key} = {info.lathe_label}")
+        write(f"lathe-category-{info.lathe_key} = {info.lathe_label}\n")
 
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def render_lathe_category_prototypes(categories: Sequence[CategoryInfo]) -> str:
     """Render latheCategory prototype entries."""
-    header = "# Auto-generated by tools/render_starlight.py. Do not edit manually."
-    lines: List[str] = [header]
+    buf = StringIO()
+    write = buf.write
+    write(GENERATED_HEADER + "\n")
 
     for info in categories:
-        lines.append("")
-        lines.append("- type: latheCategory")
-        lines.append(f"  id: {info.lathe_id}")
-        lines.append(f"  name: lathe-category-{info.lathe_key}")
+        write(f"\n- type: latheCategory\n  id: {info.lathe_id}\n  name: lathe-category-{info.lathe_key}\n")
 
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def parse_recipe_categories(mapping_args: Sequence[str]) -> Dict[str, str]:
@@ -444,6 +501,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Toggle applyMaterialDiscount for generated recipes (default false).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every document instead of reusing the parse cache in dist/.",
+    )
     return parser
 
 
@@ -451,8 +513,11 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser = build_arg_parser()
     args = parser.parse_args(argv)
 
+    cache_path, cache = load_document_cache(
+        args.docs_dir, None if args.no_cache else DEFAULT_CACHE_DIR
+    )
     try:
-        documents = discover_documents(args.docs_dir)
+        documents = discover_documents(args.docs_dir, cache)
     except PaperParseError as exc:
         parser.error(str(exc))
         return 2
@@ -465,37 +530,48 @@ def main(argv: Sequence[str] | None = None) -> int:
         parser.error(str(exc))
         return 2
 
-    categories = build_category_infos(documents, overrides)
-    prototypes_text = render_starlight_documents(documents, categories, not args.show_in_spawn_menu)
-    doc_printer_text = render_ftl_bundle(documents)
-    documents_yaml_text = render_documents_yaml(documents)
-    recipes_text = render_starlight_recipes(
-        documents,
-        categories,
-        recipe_category_overrides,
-        args.recipe_time,
-        materials,
-        args.apply_material_discount,
+    primaries = primary_categories(documents)
+    categories = build_category_infos(documents, overrides, primaries)
+    groups = group_documents(documents, categories, primaries)
+    jobs = (
+        (args.doc_printer_output, partial(render_ftl_bundle, documents)),
+        (args.documents_output, partial(render_documents_yaml, documents)),
+        (args.prototypes_output, partial(render_starlight_documents, groups, not args.show_in_spawn_menu)),
+        (
+            args.recipes_output,
+            partial(
+                render_starlight_recipes,
+                groups,
+                recipe_category_overrides,
+                args.recipe_time,
+                materials,
+                args.apply_material_discount,
+            ),
+        ),
+        (args.pack_output, partial(render_recipe_pack, groups, args.pack_id)),
+        (args.lathe_categories_output, partial(render_lathe_categories, categories)),
+        (args.lathe_category_prototypes_output, partial(render_lathe_category_prototypes, categories)),
     )
-    pack_text = render_recipe_pack(documents, categories, args.pack_id)
-    lathe_categories_text = render_lathe_categories(categories)
-    lathe_category_prototypes_text = render_lathe_category_prototypes(categories)
-
-    changes: List[str] = []
-    if write_output(doc_printer_text.rstrip("\n"), args.doc_printer_output):
-        changes.append(str(args.doc_printer_output))
-    if write_output(documents_yaml_text.rstrip("\n"), args.documents_output):
-        changes.append(str(args.documents_output))
-    if write_output(prototypes_text.rstrip("\n"), args.prototypes_output):
-        changes.append(str(args.prototypes_output))
-    if write_output(recipes_text.rstrip("\n"), args.recipes_output):
-        changes.append(str(args.recipes_output))
-    if write_output(pack_text.rstrip("\n"), args.pack_output):
-        changes.append(str(args.pack_output))
-    if write_output(lathe_categories_text.rstrip("\n"), args.lathe_categories_output):
-        changes.append(str(args.lathe_categories_output))
-    if write_output(lathe_category_prototypes_text.rstrip("\n"), args.lathe_category_prototypes_output):
-        changes.append(str(args.lathe_category_prototypes_output))
+    destinations = [destination for destination, _ in jobs]
+
+    # Renderers are independent, so they and the writes run on a shared pool. Every output
+    # is rendered before the first write, so a rendering error leaves all outputs
+    # untouched; write_output then skips files whose bytes already match.
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        texts = list(executor.map(lambda job: job[1](), jobs))
+        written = list(
+            executor.map(
+                lambda text, destination: write_output(text.rstrip("\n"), destination),
+                texts,
+                destinations,
+            )
+        )
+    changes: List[str] = [
+        str(destination) for destination, changed in zip(destinations, written) if changed
+    ]
+
+    if cache_path is not None:
+        save_cache(cache_path, cache)
 
     if changes:
         joined = ", ".join(changes)
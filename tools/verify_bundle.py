@@ -5,18 +5,202 @@ from __future__ import annotations
 
 import argparse
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
 
 import yaml
 
-
-FTL_ENTRY_RE = re.compile(r"^(?P<key>[a-z0-9\-]+)\s*=")
-
-
-def _read_yaml_sequence(path: Path) -> List[dict]:
-    text = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(text)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Anchored per line: comments, blank lines and indented continuation lines never match.
+FTL_ENTRY_PATTERN = r"^(?P<key>{prefix}[a-z0-9\-]*)[ \t]*="
+STARLIGHT_HEADER = "# Auto-generated by tools/render_starlight.py."
+
+
+def _load_yaml(path: Path, fast: bool = False) -> object:
+    """Parse a YAML file, reusing the previous result while its content is unchanged.
+
+    With ``fast=True``, files carrying the render_starlight.py header are read by
+    ``_scan_generated_sequence`` instead of a full YAML parse when their shape allows it.
+    """
+    return _parse_yaml_bytes(path.read_bytes(), fast)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_bytes(raw: bytes, fast: bool) -> object:
+    # Keyed on the content rather than the file stat: on filesystems with coarse
+    # timestamps a same-size rewrite can keep its mtime. The parsed object is shared
+    # between calls; callers must treat it as read-only.
+    if fast and raw.startswith(STARLIGHT_HEADER.encode("utf-8")):
+        scanned = _scan_generated_sequence(raw.decode("utf-8"))
+        if scanned is not None:
+            return scanned
+    return yaml.load(raw, Loader=_YamlLoader)
+
+
+class _NotPlain(Exception):
+    """Raised by the scanners when the input needs a real YAML parser."""
+
+
+_SCAN_KEY_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*\Z")
+# Characters that change meaning when they open a plain scalar.
+_SCAN_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+_SCAN_RESOLVER = yaml.resolver.Resolver()
+_STR_TAG = "tag:yaml.org,2002:str"
+_INT_TAG = "tag:yaml.org,2002:int"
+_BOOL_TAG = "tag:yaml.org,2002:bool"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_SKIPPABLE_TAGS = frozenset((_STR_TAG, _BOOL_TAG, _NULL_TAG))
+_DECIMAL_RE = re.compile(r"-?(?:0|[1-9][0-9]*)\Z")
+# Tabs and every YAML line break other than "\n" change how the file is tokenised.
+_SCAN_REJECT_RE = re.compile("[\t\r\x85\u2028\u2029]")
+# Flow list items are prototype ids; anything richer goes through the YAML parser.
+_SCAN_FLOW_ITEM_RE = re.compile(r"[A-Za-z0-9_.\-]+\Z")
+
+
+def _scan_scalar(value: str, flow: bool = False) -> object:
+    """Return ``value`` as PyYAML would load it, if it is a plain scalar we can type."""
+    if (
+        not value
+        or value[0] in _SCAN_INDICATORS
+        or ": " in value
+        or " #" in value
+        or value.endswith(":")
+        or "'" in value
+        or '"' in value
+        or (flow and not _SCAN_FLOW_ITEM_RE.match(value))
+    ):
+        raise _NotPlain(value)
+    tag = _SCAN_RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+    if tag == _STR_TAG:
+        return value
+    if tag == _INT_TAG and _DECIMAL_RE.match(value):
+        return int(value)
+    if tag == _BOOL_TAG and value in ("true", "false"):
+        return value == "true"
+    raise _NotPlain(value)
+
+
+def _split_field(text: str) -> Tuple[str, str]:
+    text = text.rstrip()
+    if text.endswith(":") and ": " not in text:
+        key, value = text[:-1], ""
+    else:
+        key, sep, value = text.partition(": ")
+        if not sep:
+            raise _NotPlain(text)
+    key = key.strip()
+    if not _SCAN_KEY_RE.match(key):
+        raise _NotPlain(text)
+    return key, value.strip()
+
+
+def _is_field(text: str) -> bool:
+    return ": " in text or text.rstrip().endswith(":")
+
+
+def _scan_generated_sequence(text: str) -> List[dict] | None:
+    """Read the fixed block layout emitted by render_starlight.py without a YAML parser.
+
+    Every line must sit at the exact indentation the generator uses (entries at column
+    0, fields at 2, block items at 2 or 4, item fields at 6, one space after ``- ``) and
+    hold only plain scalars, which are typed with PyYAML's own resolver; ``[ a, b ]``
+    flow lists become lists. Returns ``None`` for anything else (tabs, control
+    characters, quotes, comments after values, ...) so the caller falls back to a real
+    YAML parse, which also reports malformed input.
+    """
+    if _SCAN_REJECT_RE.search(text) or yaml.reader.Reader.NON_PRINTABLE.search(text):
+        return None
+    try:
+        return _scan_lines(text)
+    except _NotPlain:
+        return None
+
+
+def _scan_lines(text: str) -> List[dict]:
+    entries: List[dict] = []
+    entry: dict | None = None
+    # The open ``key:`` block of the current entry, the column its items use, and the
+    # mapping started by the latest block item (whose fields sit at column 6).
+    block_key: str | None = None
+    block_indent = 0
+    item: dict | None = None
+    for line in text.split("\n"):
+        line = line.rstrip(" ")
+        rest = line.lstrip(" ")
+        if not rest or rest.startswith("#"):
+            continue
+        indent = len(line) - len(rest)
+        dash = rest.startswith("- ")
+        content = rest[2:] if dash else rest
+        if dash and content.startswith(" ") or rest == "-":
+            raise _NotPlain(line)
+
+        if indent == 0 and dash:
+            key, value = _split_field(content)
+            entry = {key: _scan_scalar(value)}
+            entries.append(entry)
+            block_key = item = None
+        elif entry is None:
+            raise _NotPlain(line)
+        elif indent == 2 and not dash:
+            key, value = _split_field(content)
+            item = None
+            block_key = None
+            if not value:
+                # Filled in by the first child line; an empty block stays null, as in YAML.
+                entry[key] = None
+                block_key = key
+                block_indent = 0
+            elif value.startswith("[") and value.endswith("]"):
+                parts = [part.strip() for part in value[1:-1].split(",")]
+                if parts == [""]:
+                    parts = []
+                entry[key] = [_scan_scalar(part, flow=True) for part in parts]
+            else:
+                entry[key] = _scan_scalar(value)
+        elif block_key is None:
+            raise _NotPlain(line)
+        elif dash and indent in (2, 4):
+            block = entry[block_key]
+            if block is None:
+                block = entry[block_key] = []
+                block_indent = indent
+            if not isinstance(block, list) or indent != block_indent:
+                raise _NotPlain(line)
+            if _is_field(content):
+                # Only the indented style can carry item fields at column 6.
+                if indent != 4:
+                    raise _NotPlain(line)
+                key, value = _split_field(content)
+                item = {key: _scan_scalar(value)}
+                block.append(item)
+            else:
+                block.append(_scan_scalar(content))
+                item = None
+        elif indent == 4 and not dash:
+            block = entry[block_key]
+            if block is None:
+                block = entry[block_key] = {}
+            if not isinstance(block, dict):
+                raise _NotPlain(line)
+            key, value = _split_field(content)
+            block[key] = _scan_scalar(value)
+        elif indent == 6 and not dash and item is not None:
+            key, value = _split_field(content)
+            item[key] = _scan_scalar(value)
+        else:
+            raise _NotPlain(line)
+    return entries
+
+
+def _read_yaml_sequence(path: Path, fast: bool = False) -> List[dict]:
+    data = _load_yaml(path, fast)
     if data is None:
         return []
     if isinstance(data, list):
@@ -27,34 +211,176 @@ def _read_yaml_sequence(path: Path) -> List[dict]:
     raise TypeError(f"Unsupported YAML structure in {path}: expected list or dict.")
 
 
+@lru_cache(maxsize=None)
+def _ftl_entry_re(expected_prefix: str) -> re.Pattern[str]:
+    # The prefix is part of the pattern, so non-matching keys are rejected by the regex
+    # engine rather than by a per-match startswith check.
+    return re.compile(FTL_ENTRY_PATTERN.format(prefix=re.escape(expected_prefix)), re.MULTILINE)
+
+
 def _parse_ftl_keys(path: Path, expected_prefix: str) -> Set[str]:
-    keys: Set[str] = set()
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        stripped = raw_line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        match = FTL_ENTRY_RE.match(stripped)
-        if not match:
-            continue
-        key = match.group("key")
-        if key.startswith(expected_prefix):
-            keys.add(key)
-    return keys
+    text = path.read_text(encoding="utf-8")
+    return {match.group("key") for match in _ftl_entry_re(expected_prefix).finditer(text)}
+
+
+def _extract_documents(documents_path: Path) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Return the document keys and category ids listed in documents.yml."""
+    return _extract_documents_bytes(documents_path.read_bytes())
+
 
+@lru_cache(maxsize=32)
+def _extract_documents_bytes(raw: bytes) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    try:
+        return _scan_document_events(iter(yaml.parse(raw, Loader=_YamlLoader)))
+    except _NotPlain:
+        return _collect_documents(yaml.load(raw, Loader=_YamlLoader))
 
-def _extract_documents(documents_path: Path) -> Tuple[Dict[str, dict], Set[str]]:
-    data = yaml.safe_load(documents_path.read_text(encoding="utf-8")) or {}
-    documents = data.get("documents") or []
-    doc_map: Dict[str, dict] = {}
+
+def _collect_documents(data: object) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Walk a fully loaded documents.yml; the event scan must agree with this."""
+    keys: Set[str] = set()
     categories: Set[str] = set()
-    for entry in documents:
+    for entry in (data or {}).get("documents") or []:
         key = entry.get("key")
         if not key:
             continue
-        doc_map[key] = entry
-        for cat in entry.get("categories") or []:
-            categories.add(cat)
-    return doc_map, categories
+        keys.add(key)
+        categories.update(entry.get("categories") or [])
+    return frozenset(keys), frozenset(categories)
+
+
+def _scan_document_events(events: Iterator[yaml.Event]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Read ``documents[*].key`` and ``documents[*].categories`` from the event stream.
+
+    Other fields must be plain scalars and are skipped without building nodes. Raises
+    ``_NotPlain`` on anything whose full load could differ from what is seen here
+    (aliases, tags, merge keys, non-string values, duplicate keys, several YAML
+    documents, ...), so the caller can fall back to ``_collect_documents``.
+    """
+    keys: Set[str] = set()
+    categories: Set[str] = set()
+    events = _unaliased(events)
+    _expect(events, yaml.StreamStartEvent)
+    event = next(events)
+    if isinstance(event, yaml.StreamEndEvent):
+        return frozenset(), frozenset()
+    if not isinstance(event, yaml.DocumentStartEvent):
+        raise _NotPlain(event)
+    _expect(events, yaml.MappingStartEvent)
+    seen_documents = False
+    for name, value in _mapping_items(events):
+        if name != "documents":
+            _skip_node(events, value)
+        elif seen_documents:
+            raise _NotPlain(value)
+        else:
+            seen_documents = True
+            for entry in _sequence_items(events, value):
+                if not isinstance(entry, yaml.MappingStartEvent):
+                    raise _NotPlain(entry)
+                key, entry_categories = _scan_document_entry(events)
+                if key:
+                    keys.add(key)
+                    categories.update(entry_categories)
+    _expect(events, yaml.DocumentEndEvent)
+    _expect(events, yaml.StreamEndEvent)
+    return frozenset(keys), frozenset(categories)
+
+
+def _unaliased(events: Iterator[yaml.Event]) -> Iterator[yaml.Event]:
+    # Anchors and aliases are resolved (and duplicate anchors rejected) by the composer.
+    for event in events:
+        if isinstance(event, yaml.AliasEvent) or getattr(event, "anchor", None) is not None:
+            raise _NotPlain(event)
+        yield event
+
+
+def _scan_document_entry(events: Iterator[yaml.Event]) -> Tuple[str, List[str]]:
+    key: str | None = None
+    categories: List[str] | None = None
+    for name, value in _mapping_items(events):
+        if name == "key" and key is None:
+            key = _event_str(value)
+        elif name == "categories" and categories is None:
+            categories = [_event_str(item) for item in _sequence_items(events, value)]
+        elif name in ("key", "categories"):
+            # Duplicate keys: the full load keeps the last one.
+            raise _NotPlain(value)
+        else:
+            _skip_node(events, value)
+    return key or "", categories or []
+
+
+def _mapping_items(
+    events: Iterator[yaml.Event], read_key: Callable[[yaml.Event], str] | None = None
+) -> Iterator[Tuple[str, yaml.Event]]:
+    # Yields each key with the first event of its value; the caller consumes the value.
+    read_key = read_key or _event_str
+    while True:
+        event = next(events)
+        if isinstance(event, yaml.MappingEndEvent):
+            return
+        yield read_key(event), next(events)
+
+
+def _sequence_items(events: Iterator[yaml.Event], start: yaml.Event) -> Iterator[yaml.Event]:
+    # A null value loads as an empty list for our purposes; any other scalar does not.
+    if isinstance(start, yaml.ScalarEvent) and _event_null(start):
+        return
+    if not isinstance(start, yaml.SequenceStartEvent):
+        raise _NotPlain(start)
+    while True:
+        event = next(events)
+        if isinstance(event, yaml.SequenceEndEvent):
+            return
+        yield event
+
+
+def _skip_node(events: Iterator[yaml.Event], start: yaml.Event) -> None:
+    # Only nodes that always construct are skipped: untagged collections with scalar keys
+    # and plain scalars. Aliases, tags, merge keys and values such as malformed
+    # timestamps could make the full load fail, so they raise instead.
+    if isinstance(start, yaml.MappingStartEvent) and start.tag is None:
+        for _, value in _mapping_items(events, _skip_scalar):
+            _skip_node(events, value)
+    elif isinstance(start, yaml.SequenceStartEvent) and start.tag is None:
+        for item in _sequence_items(events, start):
+            _skip_node(events, item)
+    else:
+        _skip_scalar(start)
+
+
+def _skip_scalar(event: yaml.Event) -> str:
+    if not isinstance(event, yaml.ScalarEvent) or event.tag is not None:
+        raise _NotPlain(event)
+    tag = _event_resolved_tag(event)
+    if tag not in _SKIPPABLE_TAGS and not (tag == _INT_TAG and _DECIMAL_RE.match(event.value)):
+        raise _NotPlain(event)
+    return event.value
+
+
+def _expect(events: Iterator[yaml.Event], kind: type) -> None:
+    event = next(events)
+    if not isinstance(event, kind):
+        raise _NotPlain(event)
+
+
+def _event_resolved_tag(event: yaml.ScalarEvent) -> str | None:
+    if event.tag is not None:
+        return event.tag
+    if event.implicit[0]:
+        return _SCAN_RESOLVER.resolve(yaml.ScalarNode, event.value, (True, False))
+    return _STR_TAG
+
+
+def _event_str(event: yaml.Event) -> str:
+    if not isinstance(event, yaml.ScalarEvent) or _event_resolved_tag(event) != _STR_TAG:
+        raise _NotPlain(event)
+    return event.value
+
+
+def _event_null(event: yaml.ScalarEvent) -> bool:
+    return _event_resolved_tag(event) == _NULL_TAG
 
 
 def verify_bundle(
@@ -65,23 +391,27 @@ def verify_bundle(
     pack_path: Path,
     category_prototypes_path: Path,
     category_ftl_path: Path,
+    fast: bool = False,
 ) -> List[str]:
-    """Return a list of consistency issues discovered across generated outputs."""
+    """Return a list of consistency issues discovered across generated outputs.
+
+    With ``fast`` set, Starlight outputs that still carry the generator header are read
+    with a lightweight scanner instead of a full YAML parse; anything outside the exact
+    layout the generator emits falls back to the full parse.
+    """
     errors: List[str] = []
 
-    doc_map, doc_category_ids = _extract_documents(documents_path)
-    if not doc_map:
+    doc_keys, doc_category_ids = _extract_documents(documents_path)
+    if not doc_keys:
         errors.append(f"No documents found in {documents_path}")
 
-    doc_keys = set(doc_map.keys())
-
     ftl_keys = _parse_ftl_keys(ftl_path, "doc-text-printer-")
     missing_ftl = doc_keys - ftl_keys
     if missing_ftl:
         joined = ", ".join(sorted(missing_ftl))
         errors.append(f"doc-printer.ftl missing entries for: {joined}")
 
-    prototypes = _read_yaml_sequence(prototypes_path)
+    prototypes = _read_yaml_sequence(prototypes_path, fast)
     entity_ids: Dict[str, dict] = {}
     for entry in prototypes:
         if entry.get("type") != "entity":
@@ -95,7 +425,11 @@ def verify_bundle(
             continue
         entity_ids[entity_id] = entry
         components = entry.get("components") or []
-        paper = next((comp for comp in components if comp.get("type") == "Paper"), None)
+        paper = None
+        for comp in components:
+            if comp.get("type") == "Paper":
+                paper = comp
+                break
         if not paper:
             errors.append(f"{entity_id} missing Paper component in {prototypes_path}")
             continue
@@ -105,7 +439,7 @@ def verify_bundle(
                 f"{entity_id} references unknown paperwork key '{content_key}'"
             )
 
-    recipes = _read_yaml_sequence(recipes_path)
+    recipes = _read_yaml_sequence(recipes_path, fast)
     recipe_ids: Dict[str, dict] = {}
     recipe_category_ids: Set[str] = set()
     for entry in recipes:
@@ -127,7 +461,7 @@ def verify_bundle(
         for cat in entry.get("categories") or []:
             recipe_category_ids.add(cat)
 
-    pack_entries = _read_yaml_sequence(pack_path)
+    pack_entries = _read_yaml_sequence(pack_path, fast)
     for entry in pack_entries:
         if entry.get("type") != "latheRecipePack":
             continue
@@ -137,7 +471,7 @@ def verify_bundle(
                     f"Recipe pack {entry.get('id')} references unknown recipe '{recipe_id}'"
                 )
 
-    category_prototypes = _read_yaml_sequence(category_prototypes_path)
+    category_prototypes = _read_yaml_sequence(category_prototypes_path, fast)
     lathe_category_ids: Dict[str, str] = {}
     for entry in category_prototypes:
         if entry.get("type") != "latheCategory":
@@ -155,37 +489,40 @@ def verify_bundle(
             continue
         lathe_category_ids[category_id] = name
 
-    missing_category_ids = doc_category_ids - set(lathe_category_ids.keys())
+    lathe_ids = lathe_category_ids.keys()
+    lathe_names = set(lathe_category_ids.values())
+
+    missing_category_ids = doc_category_ids - lathe_ids
     if missing_category_ids:
         joined = ", ".join(sorted(missing_category_ids))
         errors.append(f"documents.yml references undefined lathe categories: {joined}")
 
-    missing_recipe_categories = recipe_category_ids - set(lathe_category_ids.keys())
+    missing_recipe_categories = recipe_category_ids - lathe_ids
     if missing_recipe_categories:
         joined = ", ".join(sorted(missing_recipe_categories))
         errors.append(f"lathe recipes reference undefined categories: {joined}")
 
     category_ftl_keys = _parse_ftl_keys(category_ftl_path, "lathe-category-")
-    missing_ftl_categories = set(lathe_category_ids.values()) - category_ftl_keys
+    missing_ftl_categories = lathe_names - category_ftl_keys
     if missing_ftl_categories:
         joined = ", ".join(sorted(missing_ftl_categories))
         errors.append(
             f"lathe-categories.ftl missing definitions for: {joined}"
         )
 
-    undefined_ftl_categories = category_ftl_keys - set(lathe_category_ids.values())
+    undefined_ftl_categories = category_ftl_keys - lathe_names
     if undefined_ftl_categories:
         joined = ", ".join(sorted(undefined_ftl_categories))
         errors.append(
             f"lathe-categories.ftl defines unused categories: {joined}"
         )
 
-    unused_category_ids = set(lathe_category_ids.keys()) - doc_category_ids
+    unused_category_ids = lathe_ids - doc_category_ids
     for cat in unused_category_ids:
         if cat not in recipe_category_ids:
             errors.append(f"latheCategory '{cat}' is not referenced by documents or recipes")
 
-    missing_recipe_category_usage = set(lathe_category_ids.keys()) - recipe_category_ids
+    missing_recipe_category_usage = lathe_ids - recipe_category_ids
     if missing_recipe_category_usage:
         joined = ", ".join(sorted(missing_recipe_category_usage))
         errors.append(f"No recipes reference categories: {joined}")
@@ -237,6 +574,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=Path("dist/starlight/lathe-categories.ftl"),
         help="Path to generated lathe categories Fluent file.",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Scan generated Starlight files instead of parsing them as full YAML.",
+    )
     return parser
 
 
@@ -252,6 +594,7 @@ def main(argv: Iterable[str] | None = None) -> int:
         args.starlight_pack,
         args.starlight_categories,
         args.lathe_categories_ftl,
+        fast=args.fast,
     )
 
     if errors: